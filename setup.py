@@ -25,8 +25,15 @@ setup(
     ],
     python_requires=">=3.7", 
     install_requires=[
-        "requests>=2.25.1",
-        "pandas>=1.1.0",
+        "requests>=2.27",
+        "urllib3>=1.26",
+        "pandas>=1.2.0",
+        "numpy>=1.16",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.0", "requests-toolbelt>=0.9", "brotli>=1.0.9"],
+        "async": ["httpx[http2]>=0.23"],
+        "streaming": ["ijson>=3.1"],
+    },
     include_package_data=True,
 )
@@ -4,5 +4,6 @@ Vepi - A Python package for interacting with Vena's ETL and data export APIs.
 
 from .version import __version__
 from .vena_etl import VenaETL
+from .async_vena_etl import AsyncVenaETL
 
-__all__ = ["VenaETL"] 
\ No newline at end of file
+__all__ = ["VenaETL", "AsyncVenaETL"] 
\ No newline at end of file
@@ -0,0 +1,745 @@
+"""
+Asynchronous Vena ETL Client for Python
+
+This module provides an asyncio client for Vena's ETL API built on httpx.
+Requests share one HTTP/2 connection where the server supports it, so status
+polls for many jobs and export page fetches are multiplexed instead of each
+needing its own connection.
+
+Example usage:
+    >>> import asyncio
+    >>> from vepi import AsyncVenaETL
+    >>>
+    >>> async def main():
+    ...     async with AsyncVenaETL(
+    ...         hub='us1',
+    ...         api_user='your_api_user',
+    ...         api_key='your_api_key',
+    ...         template_id='your_template_id',
+    ...         data_source='your_erp_or_data_source',
+    ...         model_id='your_model_id'
+    ...     ) as client:
+    ...         await client.import_dataframe(df)
+    ...         exported_data = await client.export_data()
+    >>>
+    >>> asyncio.run(main())
+"""
+
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, Union, List, Dict, Any, AsyncIterator, Tuple, TextIO, BinaryIO
+import numpy as np
+import pandas as pd
+from .vena_etl import _BaseVenaETL, simdjson
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_log = logging.getLogger(__name__)
+
+class AsyncVenaETL(_BaseVenaETL):
+    """
+    Asynchronous client for interacting with Vena's ETL API.
+
+    Mirrors the VenaETL API with coroutines. Requires the optional httpx
+    dependency (``pip install "vepi[async]"``).
+
+    Attributes:
+        hub (str): Data center hub (e.g., us1, us2, ca3)
+        api_user (str): API user from Vena authentication token
+        api_key (str): API key from Vena authentication token
+        template_id (str): ETL template ID
+        data_source (str): Please indicate the ERP or data source, this helps Vena with support and troubleshooting.(e.g., NetSuite, Dynamics 365, SAP, ADP, Other)
+        model_id (str, optional): Model ID for export operations
+    """
+
+    def __init__(self, hub: str, api_user: str, api_key: str, template_id: str, data_source: str, model_id: Optional[str] = None, compress_uploads: bool = False, max_connections: int = 50, max_keepalive_connections: int = 20, timeout: Optional[float] = 30.0):
+        """
+        Initialize the asynchronous Vena ETL client.
+
+        Args:
+            hub (str): Data center hub (e.g., us1, us2, ca3)
+            api_user (str): API user from Vena authentication token
+            api_key (str): API key from Vena authentication token
+            template_id (str): ETL template ID
+            data_source (str): Please indicate the ERP or data source, this helps Vena with support and troubleshooting.(e.g., NetSuite, Dynamics 365, SAP, ADP, Other)
+            model_id (str, optional): Model ID for export operations
+            compress_uploads (bool): Gzip-compress startWithData request bodies (default: False)
+            max_connections (int): Maximum number of concurrent connections (default: 50)
+            max_keepalive_connections (int): Maximum number of idle connections kept open (default: 20)
+            timeout (float, optional): Seconds to wait when connecting, or for each read or
+                write on a connection; None waits indefinitely (default: 30)
+
+        """
+        if httpx is None:
+            raise ImportError('AsyncVenaETL requires httpx. Install it with: pip install "vepi[async]"')
+
+        super().__init__(hub, api_user, api_key, template_id, data_source, model_id, compress_uploads)
+
+        # httpx negotiates its own accept-encoding, and a client-wide content-type
+        # would override the multipart boundary on file uploads
+        client_headers = {
+            key: value for key, value in self.headers.items()
+            if key not in ("accept-encoding", "content-type")
+        }
+        self._json_content_type = {"content-type": "application/json"}
+        self._data_post_headers = {**self._json_content_type, **self._data_headers}
+        self._client = httpx.AsyncClient(
+            http2=True,
+            auth=(api_user, api_key),
+            headers=client_headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=httpx.Timeout(timeout)
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and release its connections.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncVenaETL":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    @staticmethod
+    def _json_error(response: Any, error: ValueError) -> Exception:
+        """
+        Build the exception raised when a response body is not valid JSON.
+
+        Raising an httpx exception lets callers that handle httpx.HTTPError also
+        handle bodies that fail to decode.
+
+        Args:
+            response: httpx response whose body failed to decode
+            error (ValueError): Error raised by the JSON decoder
+
+        Returns:
+            Exception: httpx.DecodingError describing the failure
+        """
+        return httpx.DecodingError(f"Invalid JSON in response body: {error}", request=response.request)
+
+    async def start_with_data(self, json_data: Union[pd.DataFrame, np.ndarray, List[List[Any]]]) -> None:
+        """
+        Starts an ETL job with the provided JSON data and checks job status before completing.
+
+        Args:
+            json_data (Union[pd.DataFrame, np.ndarray, List[List[Any]]]): Data to import, either as a DataFrame,
+                a 2D NumPy array (requires orjson) or array of arrays
+        """
+        try:
+            job_id = await self._submit_data(json_data)
+        except httpx.HTTPError as e:
+            _log.error("Failed to start ETL job: %s", e)
+            return
+
+        await self._wait_for_job(job_id)
+
+    async def _submit_data(self, json_data: Union[pd.DataFrame, np.ndarray, List[List[Any]]], validated: bool = False) -> str:
+        """
+        Start an ETL job with the provided data without waiting for it to finish.
+
+        Args:
+            json_data (Union[pd.DataFrame, np.ndarray, List[List[Any]]]): Data to import
+            validated (bool): Skip DataFrame validation because the caller already did it
+
+        Returns:
+            str: ID of the started job
+
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        # Serialization is CPU-bound, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        body = await loop.run_in_executor(None, self._encode_data_body, json_data, validated)
+        response = await self._client.post(self.start_with_data_url, content=body, headers=self._data_post_headers)
+        response.raise_for_status()
+        return self._loads_response(response)['id']
+
+    async def start_with_file(self, file: Union[str, pd.DataFrame, TextIO, BinaryIO], filename: str = None) -> str:
+        """
+        Start an ETL job using a file or DataFrame.
+
+        Args:
+            file: Can be one of:
+                - str: Path to a CSV file
+                - pd.DataFrame: DataFrame to convert to CSV
+                - TextIO/BinaryIO: File-like object containing CSV data
+            filename (str, optional): Name for the file in Vena. If not provided,
+                will use the input filename or generate a default name.
+
+        Returns:
+            str: Job ID for monitoring
+
+        Raises:
+            ValueError: If file is invalid or empty
+            httpx.HTTPError: If API request fails
+        """
+        loop = asyncio.get_running_loop()
+        files = await loop.run_in_executor(None, self._build_upload_files, file, filename)
+
+        try:
+            try:
+                response = await self._client.post(self.start_with_file_url, files=files)
+            finally:
+                self._close_upload_files(files)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            _log.error("Error starting ETL job: %s\n%s", e, self._extract_error(e))
+            raise
+        except httpx.HTTPError as e:
+            _log.error("Error starting ETL job: %s", e)
+            raise
+
+        job_id = self._loads_response(response).get('id')
+        if not job_id:
+            raise ValueError("No job ID received from Vena API")
+
+        _log.info("ETL job started with ID: %s", job_id)
+
+        await self._wait_for_job(job_id)
+
+        return job_id
+
+    async def _wait_for_job(self, job_id: str, initial: float = 0.1, factor: float = 1.5, cap: float = 30.0) -> None:
+        """
+        Wait for an ETL job to finish, polling its status with exponential backoff.
+
+        Args:
+            job_id (str): ID of the job to monitor
+            initial (float): Delay before the second status check (in seconds)
+            factor (float): Multiplier applied to the delay after each poll
+            cap (float): Maximum delay between polls (in seconds)
+
+        Raises:
+            Exception: If the job ends in ERROR or CANCELLED, or its status cannot be read
+        """
+        await self._wait_for_jobs([job_id], initial, factor, cap)
+
+    async def _wait_for_jobs(self, job_ids: List[str], initial: float = 0.1, factor: float = 1.5, cap: float = 30.0) -> None:
+        """
+        Wait for several ETL jobs to finish, checking all outstanding jobs concurrently on each tick.
+
+        The first round runs immediately. The delay between rounds then starts at
+        ``initial`` and grows by ``factor`` up to ``cap`` seconds, dropping back to
+        ``initial`` whenever a job moves to a new status. A Retry-After header on
+        any status response takes precedence.
+
+        Args:
+            job_ids (List[str]): IDs of the jobs to monitor
+            initial (float): Delay before the second round of status checks (in seconds)
+            factor (float): Multiplier applied to the delay after each round
+            cap (float): Maximum delay between rounds (in seconds)
+
+        Raises:
+            Exception: If any job ends in ERROR or CANCELLED, or its status cannot be read
+        """
+        pending = list(job_ids)
+        delay = initial
+        last_status = {}
+
+        while pending:
+            results = await asyncio.gather(*(self._check_job(job_id) for job_id in pending))
+
+            transitioned = False
+            still_running = []
+            for job_id, (job_status, _) in zip(pending, results):
+                if job_status == "COMPLETED":
+                    continue
+                if last_status.get(job_id, job_status) != job_status:
+                    transitioned = True
+                last_status[job_id] = job_status
+                still_running.append(job_id)
+
+            pending = still_running
+            if not pending:
+                break
+
+            hints = [hint for _, hint in results if hint is not None]
+            if hints:
+                await asyncio.sleep(max(hints))
+            else:
+                if transitioned:
+                    delay = initial
+                await asyncio.sleep(delay)
+                delay = min(delay * factor, cap)
+
+    async def _check_job(self, job_id: str) -> Tuple[str, Optional[float]]:
+        """
+        Check the status of one ETL job.
+
+        Args:
+            job_id (str): ID of the job to check
+
+        Returns:
+            Tuple[str, Optional[float]]: The job status, and any Retry-After delay
+
+        Raises:
+            Exception: If the job ended in ERROR or CANCELLED, or its status cannot be read
+        """
+        try:
+            status_response = await self._client.get(self._status_url_fmt % job_id)
+            status_response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            error_msg = self._extract_error(e)
+            _log.error("Error checking job status: %s", error_msg)
+            raise Exception(f"Failed to check job status: {error_msg}")
+        except httpx.HTTPError as e:
+            _log.error("Error checking job status: %s", e)
+            raise Exception(f"Failed to check job status: {e}")
+
+        payload = self._parse_status(status_response)
+        job_status = payload.get('status') if isinstance(payload, dict) else payload
+        if job_status == "COMPLETED":
+            _log.info("Job %s completed successfully.", job_id)
+            return job_status, None
+        elif job_status in ["ERROR", "CANCELLED"]:
+            # Only fetch the full job when the status response has no error details
+            error_details = self._status_error_details(payload)
+            if not error_details:
+                error_response = await self._client.get(self._job_url(job_id))
+                error_details = self._job_error_details(error_response)
+            _log.error("Job %s ended with status: %s%s", job_id, job_status, error_details)
+            raise Exception(f"Job failed with status: {job_status}{error_details}")
+
+        _log.debug("Job %s status: %s", job_id, job_status)
+        return job_status, self._retry_after(status_response)
+
+    async def import_dataframe(self, df: pd.DataFrame, chunk_size: Optional[int] = None, max_workers: int = 4) -> None:
+        """
+        Import data from a pandas DataFrame.
+
+        By default the frame is imported as a single ETL job. When ``chunk_size`` is
+        given, frames larger than ``chunk_size`` rows are split into row chunks that
+        are submitted concurrently as separate ETL jobs, then all jobs are monitored
+        together. If only some of the chunks could be started, the jobs that did
+        start are cancelled and an exception naming them is raised.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing the data to import
+            chunk_size (Optional[int]): Maximum number of rows per ETL job, or None to
+                import the whole frame as one job (default: None)
+            max_workers (int): Maximum number of chunks uploaded at the same time (default: 4)
+
+        Raises:
+            Exception: If some chunks failed to start; the message lists the started job IDs
+        """
+        self._validate_dataframe(df)
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        if chunk_size is None or len(df) <= chunk_size:
+            try:
+                job_ids = [await self._submit_data(df, validated=True)]
+            except httpx.HTTPError as e:
+                _log.error("Failed to start ETL job: %s", e)
+                return
+        else:
+            chunks = [df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size)]
+            uploads = asyncio.Semaphore(max_workers)
+
+            async def submit(chunk: pd.DataFrame) -> str:
+                async with uploads:
+                    return await self._submit_data(chunk, validated=True)
+
+            results = await asyncio.gather(*(submit(chunk) for chunk in chunks), return_exceptions=True)
+            job_ids = []
+            errors = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                else:
+                    job_ids.append(result)
+            if errors:
+                _log.error("Failed to start %d of %d ETL jobs: %s", len(errors), len(chunks), errors[0])
+                # Cancellation and interrupts propagate as themselves once started jobs are rolled back
+                interrupt = next((e for e in errors if not isinstance(e, Exception)), None)
+                if not job_ids:
+                    # Nothing to roll back; only request failures are logged and swallowed
+                    for e in errors:
+                        if not isinstance(e, httpx.HTTPError):
+                            raise e
+                    return
+                not_cancelled = []
+                for job_id in job_ids:
+                    try:
+                        await self.cancel_job(job_id)
+                    except Exception as e:
+                        _log.error("Failed to cancel job %s: %s", job_id, e)
+                        not_cancelled.append(job_id)
+                if interrupt is not None:
+                    raise interrupt
+                raise Exception(self._partial_import_message(len(errors), len(chunks), job_ids, not_cancelled)) from errors[0]
+            _log.info("Started %d ETL jobs: %s", len(job_ids), job_ids)
+
+        await self._wait_for_jobs(job_ids)
+        _log.info("Data Import Script Finished")
+
+    async def export_data(self, page_size: int = 100000, max_workers: int = 8) -> Optional[pd.DataFrame]:
+        """
+        Export intersections data from the Vena model with pagination support.
+
+        Args:
+            page_size (int): Number of records to fetch per page (default: 5000, max: 100000)
+            max_workers (int): Maximum number of pages requested at the same time when the
+                API reports the total page count (default: 8)
+
+        Returns:
+            Optional[pd.DataFrame]: DataFrame containing all intersections data, or None if there was an error
+        """
+        if not self.model_id:
+            raise ValueError("Model ID must be set to export data")
+
+        try:
+            pages = []
+            headers = []
+            record_count = 0
+
+            async for headers, rows, next_page_url in self._aiter_export_pages(page_size, max_workers):
+                pages.append(rows)
+                record_count += len(rows)
+                if next_page_url:
+                    _log.debug("Fetching next page... (%d records so far)", record_count)
+
+            # Build the DataFrame once from all pages, with column names from metadata headers
+            if pages:
+                full = pages[0] if len(pages) == 1 else np.concatenate(pages, axis=0)
+                del pages
+                intersections_df = self._rows_to_dataframe(full, headers)
+            else:
+                intersections_df = pd.DataFrame(columns=headers)
+
+            _log.info("Total records fetched: %d", len(intersections_df))
+            return intersections_df
+
+        except httpx.HTTPError as e:
+            _log.error("Failed to export data: %s", e)
+            return None
+
+    async def iter_export(self, page_size: int = 100000, max_workers: int = 8) -> AsyncIterator[pd.DataFrame]:
+        """
+        Export intersections data from the Vena model one page at a time.
+
+        Besides the current page, at most ``max_workers`` pages are requested or
+        buffered ahead (pass ``max_workers=1`` to fetch pages one at a time).
+
+        Args:
+            page_size (int): Number of records to fetch per page (default: 100000, max: 100000)
+            max_workers (int): Maximum number of pages requested at the same time when the
+                API reports the total page count (default: 8)
+
+        Yields:
+            pd.DataFrame: Intersections data for one page
+
+        Raises:
+            ValueError: If model_id is not set
+            httpx.HTTPError: If fetching a page fails
+        """
+        if not self.model_id:
+            raise ValueError("Model ID must be set to export data")
+
+        async for headers, rows, _ in self._aiter_export_pages(page_size, max_workers):
+            if len(rows):
+                yield self._rows_to_dataframe(rows, headers)
+
+    async def _aiter_export_pages(self, page_size: int, max_workers: int = 8) -> AsyncIterator[Tuple[List[str], np.ndarray, Optional[str]]]:
+        """
+        Yield the rows of each intersections page as a 2D object array.
+
+        The request for the next page is issued as soon as its URL is known, so it
+        is in flight while the caller processes the current page. When the first
+        page reports the total page count, up to ``max_workers`` of the remaining
+        pages are requested at once instead. Decoding runs on a worker thread to
+        keep the event loop responsive.
+
+        Args:
+            page_size (int): Number of records to fetch per page
+            max_workers (int): Maximum number of pages requested at the same time
+
+        Yields:
+            Tuple[List[str], np.ndarray, Optional[str]]: Column headers (taken from the first
+                page), the page's data rows, and the URL of the next page if there is one
+        """
+        loop = asyncio.get_running_loop()
+        # One decoder thread keeps a simdjson parser, if any, on a single thread
+        decoder = ThreadPoolExecutor(max_workers=1)
+        parser = simdjson.Parser() if simdjson is not None else None
+        requests_allowed = asyncio.Semaphore(max_workers)
+
+        def decode(response: httpx.Response) -> Tuple[Dict[str, Any], np.ndarray, Optional[str]]:
+            page = self._load_page(response, parser)
+            return (page['metadata'],) + self._split_export_page(page)
+
+        async def fetch(url: str) -> Tuple[Dict[str, Any], np.ndarray, Optional[str]]:
+            async with requests_allowed:
+                response = await self._client.get(url)
+                response.raise_for_status()
+            return await loop.run_in_executor(decoder, decode, response)
+
+        headers = None
+        remaining = None
+        in_flight = deque([asyncio.ensure_future(fetch(f"{self.intersections_url}?pageSize={page_size}"))])
+        try:
+            while in_flight:
+                metadata, rows, next_page_url = await in_flight.popleft()
+                if headers is None:
+                    # Column names come from the first page; later pages repeat them
+                    headers = metadata['headers']
+                    page_urls = self._remaining_page_urls(metadata) if max_workers > 1 else None
+                    if page_urls:
+                        # Keep a bounded window of page requests ahead of the caller
+                        remaining = iter(page_urls)
+                        in_flight.extend(asyncio.ensure_future(fetch(url)) for url in islice(remaining, max_workers))
+                elif remaining is not None:
+                    for url in remaining:
+                        in_flight.append(asyncio.ensure_future(fetch(url)))
+                        break
+
+                if not in_flight and next_page_url:
+                    # Follow the cursor, including past the reported total page count
+                    remaining = None
+                    in_flight.append(asyncio.ensure_future(fetch(next_page_url)))
+                yield headers, rows, next_page_url
+        finally:
+            for pending in in_flight:
+                pending.cancel()
+            decoder.shutdown(wait=False)
+
+    async def get_dimension_hierarchy(self) -> Optional[pd.DataFrame]:
+        """
+        Get the dimension hierarchies from the Vena model.
+
+        Returns:
+            pd.DataFrame: DataFrame containing the dimension hierarchies with columns:
+                - dimension: The dimension name
+                - name: The hierarchy member name
+                - alias: The alias for the member (if any)
+                - parent: The parent member name
+                - operator: The operator for the member (+ or -)
+        """
+        if not self.model_id:
+            raise ValueError("Model ID must be set to get dimension hierarchies")
+
+        try:
+            response = await self._client.get(f'{self.base_url}/models/{self.model_id}/hierarchy')
+            response.raise_for_status()
+            data = self._loads_response(response)
+        except httpx.HTTPStatusError as e:
+            _log.error("Failed to get dimension hierarchies: %s", e)
+            _log.error("%s", self._extract_error(e))
+            return None
+        except httpx.HTTPError as e:
+            _log.error("Failed to get dimension hierarchies: %s", e)
+            return None
+
+        df = pd.DataFrame(data['data'])
+        _log.info("Retrieved %d dimension hierarchy members", len(df))
+        _log.info("Unique dimensions: %s", list(df['dimension'].unique()))
+        return df
+
+    async def upload_job_data(self, job_id: str, data: Union[pd.DataFrame, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Upload data to a job before submission.
+
+        Args:
+            job_id (str): The ID of the job to upload data to
+            data (Union[pd.DataFrame, List[Dict[str, Any]]]): The data to upload
+
+        Returns:
+            Dict[str, Any]: The upload response
+
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        loop = asyncio.get_running_loop()
+        body = await loop.run_in_executor(None, self._encode_job_data_body, data)
+        response = await self._client.post(
+            self._job_url(job_id, "data"),
+            content=body,
+            headers=self._json_content_type
+        )
+        if response.status_code == 422:
+            _log.error("Error uploading data: %s", self._extract_error(response))
+        response.raise_for_status()
+        return self._loads_response(response)
+
+    async def create_job(self) -> str:
+        """
+        Create a new ETL job in EDITING stage.
+
+        Returns:
+            str: The ID of the created job
+
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        response = await self._client.post(self.create_job_url)
+        if response.status_code == 422:
+            _log.error("Error response content: %s", response.text)
+        response.raise_for_status()
+        return self._loads_response(response).get('id')
+
+    async def submit_job(self, job_id: str) -> Dict[str, Any]:
+        """
+        Submit a job for processing.
+
+        Args:
+            job_id (str): The ID of the job to submit
+
+        Returns:
+            Dict[str, Any]: The submission response
+
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        response = await self._client.post(self._job_url(job_id, "submit"))
+        if response.status_code == 422:
+            _log.error("Error response content: %s", response.text)
+        response.raise_for_status()
+        return self._loads_response(response)
+
+    async def get_job_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get the current status of a job.
+
+        Args:
+            job_id (str): The ID of the job to check
+
+        Returns:
+            Dict[str, Any]: The job status information
+
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        return self._loads_response(await self._get_job_status_response(job_id))
+
+    async def _get_job_status_response(self, job_id: str) -> "httpx.Response":
+        """
+        Fetch the status of a job, returning the raw response so headers can be inspected.
+
+        Args:
+            job_id (str): The ID of the job to check
+
+        Returns:
+            httpx.Response: The successful status response
+
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        response = await self._client.get(self._job_url(job_id))
+        response.raise_for_status()
+        return response
+
+    async def wait_for_job_completion(self, job_id: str, poll_interval: int = 5, timeout: int = 3600) -> Dict[str, Any]:
+        """
+        Wait for a job to complete, polling its status with exponential backoff.
+
+        The delay between polls starts at ``poll_interval``, grows by half after
+        each poll up to ``max(poll_interval * 10, 60)`` seconds, and resets
+        whenever the job changes status. A Retry-After header on the status
+        response takes precedence.
+
+        Args:
+            job_id (str): The ID of the job to monitor
+            poll_interval (int): Initial delay between status checks (in seconds)
+            timeout (int): Maximum time to wait for completion (in seconds)
+
+        Returns:
+            Dict[str, Any]: The final job status
+
+        Raises:
+            TimeoutError: If the job doesn't complete within the timeout period
+            httpx.HTTPError: If the API request fails
+        """
+        cap = max(poll_interval * 10, 60)
+        delay = poll_interval
+        last_status = None
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        while True:
+            response = await self._get_job_status_response(job_id)
+            status = self._loads_response(response)
+            if status.get('status') in ['COMPLETED', 'FAILED']:
+                return status
+
+            elapsed = loop.time() - start_time
+            if elapsed >= timeout:
+                raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
+
+            if last_status is not None and status.get('status') != last_status:
+                delay = poll_interval
+            last_status = status.get('status')
+
+            retry_after = self._retry_after(response)
+            if retry_after is not None:
+                wait = retry_after
+            else:
+                wait = delay
+                delay = min(delay * 1.5, cap)
+            # Never sleep past the deadline; the job is polled once more when it arrives
+            await asyncio.sleep(min(wait, timeout - elapsed))
+
+    async def run_job(self, poll_interval: int = 5, timeout: int = 3600) -> Dict[str, Any]:
+        """
+        Run a complete job workflow: create job, submit it, and wait for completion.
+
+        Args:
+            poll_interval (int): How often to check the job status (in seconds)
+            timeout (int): Maximum time to wait for completion (in seconds)
+
+        Returns:
+            Dict[str, Any]: The final job status (see VenaETL.run_job)
+
+        Raises:
+            httpx.HTTPError: If any API request fails
+            TimeoutError: If the job doesn't complete within the timeout period
+        """
+        _log.info("Creating job...")
+        job_id = await self.create_job()
+
+        if not job_id:
+            raise ValueError("Failed to create job")
+
+        _log.info("Job created successfully with ID: %s", job_id)
+
+        _log.info("Submitting job...")
+        submit_result = await self.submit_job(job_id)
+        _log.info("Job submitted successfully: %s", submit_result)
+
+        _log.info("Waiting for job completion...")
+        final_status = await self.wait_for_job_completion(job_id, poll_interval, timeout)
+        _log.info("Job completed with status: %s", final_status.get('status'))
+
+        if final_status.get('error'):
+            _log.error("Error: %s", final_status.get('error'))
+        if final_status.get('warnings'):
+            _log.warning("Warnings: %s", final_status.get('warnings'))
+
+        return final_status
+
+    async def cancel_job(self, job_id: str) -> Dict[str, Any]:
+        """
+        Cancel a currently running ETL job.
+
+        Args:
+            job_id (str): The ID of the job to cancel
+
+        Returns:
+            Dict[str, Any]: The cancellation response (see VenaETL.cancel_job)
+
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        response = await self._client.post(self._job_url(job_id, "cancel"))
+        response.raise_for_status()
+        return self._loads_response(response)
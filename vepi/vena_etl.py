@@ -29,39 +29,81 @@ Example usage:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import time
-import sys
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import io
-from typing import Optional, Union, List, Dict, Any, TextIO
+import gzip
+import base64
+from typing import Optional, Union, List, Dict, Any, Iterator, Tuple, TextIO, BinaryIO
 import os
+from collections import deque
 from datetime import datetime
-from io import StringIO
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from .version import __version__
 import json
 
-class VenaETL:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    import ijson
+    # The pure-Python backends are far slower than buffering a page and decoding it at once
+    if ijson.backend != 'yajl2_c':
+        ijson = None
+except ImportError:
+    ijson = None
+
+_log = logging.getLogger(__name__)
+
+class _PrecomputedBasicAuth(AuthBase):
     """
-    Client for interacting with Vena's ETL API.
+    HTTP Basic auth whose Authorization header is encoded once, not on every request.
     
-    This class provides methods for:
-    - Data import and export
-    - Job creation and management
-    - Job status monitoring
-    - Job cancellation
+    Set as the session's auth rather than as a default header, so requests keeps
+    skipping its per-request .netrc lookup.
+    """
+
+    def __init__(self, username: str, password: str):
+        credentials = f"{username}:{password}".encode('latin1')
+        self.header = 'Basic ' + base64.b64encode(credentials).decode('ascii')
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        request.headers['Authorization'] = self.header
+        return request
+
+class _BaseVenaETL:
+    """
+    Configuration and transport-independent helpers shared by the Vena ETL clients.
     
-    Attributes:
-        hub (str): Data center hub (e.g., us1, us2, ca3)
-        api_user (str): API user from Vena authentication token
-        api_key (str): API key from Vena authentication token
-        template_id (str): ETL template ID
-        data_source (str): Please indicate the ERP or data source, this helps Vena with support and troubleshooting.(e.g., NetSuite, Dynamics 365, SAP, ADP, Other) 
-        model_id (str, optional): Model ID for export operations
+    Holds the API URLs and default headers and converts data to and from the
+    formats the API expects. Subclasses add the HTTP transport.
     """
     
-    def __init__(self, hub: str, api_user: str, api_key: str, template_id: str, data_source: str, model_id: Optional[str] = None):
+    def __init__(self, hub: str, api_user: str, api_key: str, template_id: str, data_source: str, model_id: Optional[str] = None, compress_uploads: bool = False):
         """
-        Initialize the Vena ETL client.
+        Validate the client configuration and build the API URLs and headers.
         
         Args:
             hub (str): Data center hub (e.g., us1, us2, ca3)
@@ -70,6 +112,7 @@ class VenaETL:
             template_id (str): ETL template ID
             data_source (str): Please indicate the ERP or data source, this helps Vena with support and troubleshooting.(e.g., NetSuite, Dynamics 365, SAP, ADP, Other)
             model_id (str, optional): Model ID for export operations
+            compress_uploads (bool): Gzip-compress startWithData request bodies (default: False)
 
         """
         if not all([hub, api_user, api_key, template_id]):
@@ -83,6 +126,7 @@ class VenaETL:
         self.api_key = api_key
         self.template_id = template_id
         self.model_id = model_id
+        self.compress_uploads = compress_uploads
         
         # API URLs
         self.base_url = f'https://{hub}.vena.io/api/public/v1'
@@ -90,6 +134,7 @@ class VenaETL:
         self.start_with_file_url = f'{self.base_url}/etl/templates/{template_id}/startWithFile'
         self.create_job_url = f'{self.base_url}/etl/templates/{template_id}/jobs'
         self.job_status_url = f'{self.base_url}/etl/jobs'  # Base URL for job operations
+        self._status_url_fmt = f'{self.job_status_url}/%s/status'  # Polled in tight loops
         self.intersections_url = f'{self.base_url}/models/{model_id}/intersections' if model_id else None
 
         def get_user_agent():
@@ -102,8 +147,12 @@ class VenaETL:
                 return f"{lib_name}/{lib_version}; platform/Other; source/{data_source}"
 
         # Headers for requests
+        # Only advertise encodings urllib3 can decode (br needs brotli installed)
+        accept_encoding = make_headers(accept_encoding=True)["accept-encoding"]
+
         self.headers = {
             "accept": "application/json",
+            "accept-encoding": accept_encoding,
             "content-type": "application/json",
             "User-Agent": get_user_agent(),
         }
@@ -113,6 +162,9 @@ class VenaETL:
             "User-Agent": get_user_agent(),
         }
 
+        # Extra headers for startWithData bodies built by _encode_data_body
+        self._data_headers = {"content-encoding": "gzip"} if compress_uploads else {}
+
     def _validate_dataframe(self, df: pd.DataFrame, required_columns: Optional[List[str]] = None) -> None:
         """
         Validate the DataFrame structure.
@@ -124,7 +176,8 @@ class VenaETL:
         if not isinstance(df, pd.DataFrame):
             raise ValueError("Input must be a pandas DataFrame")
             
-        if df.empty:
+        # Same as df.empty, spelled out on the axes
+        if len(df.index) == 0 or len(df.columns) == 0:
             raise ValueError("DataFrame cannot be empty")
             
         if required_columns:
@@ -132,64 +185,759 @@ class VenaETL:
             if missing_columns:
                 raise ValueError(f"DataFrame is missing required columns: {missing_columns}")
 
-    def _convert_dataframe_to_array(self, df: pd.DataFrame) -> List[List[Any]]:
+    def _dataframe_to_json(self, df: pd.DataFrame, validated: bool = False) -> bytes:
         """
-        Convert a pandas DataFrame to the required array format for Vena ETL.
+        Serialize a DataFrame to a JSON array of row arrays for Vena ETL.
+        
+        When orjson is installed and every column shares one NumPy numeric dtype, the
+        underlying ndarray is handed to orjson. Otherwise the rows are converted to
+        Python values and written by _dumps, which keeps every float exact.
         
         Args:
             df (pd.DataFrame): DataFrame to convert
+            validated (bool): Skip validation because the caller already validated the frame
             
         Returns:
-            List[List[Any]]: Array of arrays representing the data
+            bytes: JSON array of arrays representing the data
         """
-        self._validate_dataframe(df)
-        return df.values.tolist()
+        if not validated:
+            self._validate_dataframe(df)
+        if orjson is not None:
+            dtypes = set(df.dtypes)
+            if len(dtypes) == 1:
+                dtype = dtypes.pop()
+                if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+                    return self._dumps(np.ascontiguousarray(df.to_numpy()))
+        return self._dumps(self._json_rows(df))
 
-    def start_with_data(self, json_data: Union[pd.DataFrame, List[List[Any]]]) -> None:
+    def _to_json_is_exact(self, df: pd.DataFrame) -> bool:
         """
-        Starts an ETL job with the provided JSON data and checks job status before completing.
+        Check whether DataFrame.to_json reproduces every value of the frame exactly.
+        
+        to_json writes at most 15 digits, so a float such as ``0.1 + 0.2`` or
+        ``7.2345678901234e-09`` would be rounded. Float columns are therefore written
+        and decoded once to compare them with the originals, and object columns
+        qualify only when they hold no floats at all.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to check
+            
+        Returns:
+            bool: True if to_json output decodes back to the same values
+        """
+        float_columns = []
+        for i, dtype in enumerate(df.dtypes):
+            if isinstance(dtype, np.dtype):
+                if dtype.kind == 'f':
+                    float_columns.append(i)
+                elif dtype.kind == 'O':
+                    if pd.api.types.infer_dtype(df.iloc[:, i], skipna=True) not in ('string', 'empty', 'integer', 'boolean'):
+                        return False
+                elif dtype.kind not in 'iubM':
+                    return False
+            elif not (isinstance(dtype, pd.StringDtype) or pd.api.types.is_integer_dtype(dtype)
+                      or pd.api.types.is_bool_dtype(dtype)):
+                return False
+
+        if float_columns:
+            floats = df.iloc[:, float_columns]
+            original = floats.to_numpy(dtype=np.float64)
+            written = floats.to_json(orient='values', double_precision=15)
+            decoded = np.array(self._loads(written), dtype=np.float64).reshape(original.shape)
+            # null decodes to NaN, so infinities (written as null) fail the comparison
+            same = (decoded == original) | (np.isnan(decoded) & np.isnan(original))
+            if not same.all():
+                return False
+        return True
+
+    def _json_columns(self, df: pd.DataFrame) -> List[List[Any]]:
+        """
+        Convert each column of a DataFrame to a list of JSON-serializable Python values.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to convert
+            
+        Returns:
+            List[List[Any]]: One list of values per column (see _json_values)
+        """
+        return [self._json_values(df.iloc[:, i]) for i in range(df.shape[1])]
+
+    def _json_rows(self, df: pd.DataFrame) -> List[List[Any]]:
+        """
+        Convert a DataFrame to a list of rows of JSON-serializable Python values.
+        
+        The frame is boxed to Python objects in one pass, then only datetime columns
+        and float columns with missing values are rewritten through _json_values.
         
         Args:
-            json_data (Union[pd.DataFrame, List[List[Any]]]): Data to import, either as a DataFrame or array of arrays
+            df (pd.DataFrame): DataFrame to convert
+            
+        Returns:
+            List[List[Any]]: One list of values per row
+        """
+        converted = [i for i, dtype in enumerate(df.dtypes) if isinstance(dtype, np.dtype)
+                     and (dtype.kind == 'M' or (dtype.kind == 'f' and df.iloc[:, i].hasnans))]
+        # The boxed array may share (read-only) memory with the frame unless copied
+        rows = df.to_numpy(dtype=object, copy=bool(converted))
+        for i in converted:
+            rows[:, i] = self._json_values(df.iloc[:, i])
+        return rows.tolist()
+
+    def _json_values(self, column: pd.Series) -> List[Any]:
+        """
+        Convert a column to a list of JSON-serializable Python values.
+        
+        Floats keep their exact repr when serialized, missing floats become None and
+        datetimes are written as ISO strings with nanosecond precision.
+        
+        Args:
+            column (pd.Series): Column to convert
+            
+        Returns:
+            List[Any]: The column's values
+        """
+        dtype = column.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind == 'M':
+            return self._loads(column.to_json(orient='values', date_format='iso', date_unit='ns'))
+        values = column.tolist()
+        if isinstance(dtype, np.dtype) and dtype.kind == 'f' and column.hasnans:
+            values = [None if value != value else value for value in values]
+        return values
+
+    @staticmethod
+    def _dumps(obj: Any) -> bytes:
+        """
+        Serialize an object to UTF-8 encoded JSON.
+        
+        Uses orjson (with NumPy support) when it is installed and falls back to the
+        standard library otherwise.
+        
+        Args:
+            obj (Any): Object to serialize
+            
+        Returns:
+            bytes: JSON document
+        """
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(obj).encode('utf-8')
+
+    @staticmethod
+    def _loads(content: bytes) -> Any:
+        """
+        Deserialize a UTF-8 encoded JSON document.
+        
+        Uses orjson when it is installed and falls back to the standard library otherwise.
+        
+        Args:
+            content (bytes): JSON document, typically ``response.content``
+            
+        Returns:
+            Any: Decoded object
+        """
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
+    @staticmethod
+    def _numeric_dataframe_to_csv(df: pd.DataFrame) -> Optional[bytes]:
+        """
+        Format a purely numeric DataFrame as CSV without pandas' general-purpose writer.
+        
+        Only frames whose columns all share one NumPy integer or float64 dtype, contain no
+        missing values and have column names that need no quoting qualify. Values are
+        formatted exactly as ``to_csv`` would, matching the general path.
+        
+        Args:
+            df (pd.DataFrame): The DataFrame to convert
+            
+        Returns:
+            Optional[bytes]: UTF-8 encoded CSV, or None if the frame does not qualify
+        """
+        dtypes = set(df.dtypes)
+        if len(dtypes) != 1:
+            return None
+        dtype = dtypes.pop()
+        # float32 values would be widened by tolist() and print with spurious digits
+        if not isinstance(dtype, np.dtype) or not (dtype.kind in 'iu' or dtype == np.float64):
+            return None
+
+        header = [str(col) for col in df.columns]
+        # to_csv quotes these names (an empty name becomes "" in a one-column header)
+        if any(col == '' or any(ch in col for ch in ',"\r\n') for col in header):
+            return None
+
+        values = df.to_numpy()
+        if dtype.kind == 'f' and np.isnan(values).any():
+            return None
+
+        if dtype.kind == 'f':
+            body = '\n'.join([','.join(map(repr, row)) for row in values.tolist()])
+        else:
+            # One %-format over the whole flattened frame keeps the loop in C
+            body = '\n'.join([','.join(['%d'] * values.shape[1])] * values.shape[0]) % tuple(values.ravel().tolist())
+        return (','.join(header) + '\n' + body + '\n').encode('utf-8')
+
+    def _dataframe_to_csv_buffer(self, df: pd.DataFrame) -> io.BytesIO:
+        """
+        Convert a DataFrame to UTF-8 encoded CSV in the format required by Vena.
+        
+        The CSV is written straight into a bytes buffer so it can be handed to the
+        upload without an intermediate str copy and a separate encode pass.
+        
+        Args:
+            df (pd.DataFrame): The DataFrame to convert
+            
+        Returns:
+            io.BytesIO: Buffer positioned at the start of the CSV bytes
+        """
+        content = self._numeric_dataframe_to_csv(df)
+        if content is not None:
+            return io.BytesIO(content)
+
+        # to_csv formats each column itself; missing values are written as empty fields
+        output = io.BytesIO()
+        df.to_csv(output, index=False, header=True, encoding='utf-8')
+        output.seek(0)
+        return output
+
+    def _build_upload_files(self, file: Union[str, pd.DataFrame, TextIO, BinaryIO], filename: Optional[str] = None) -> Dict[str, Tuple[str, Any, str]]:
+        """
+        Build the multipart parts for a startWithFile upload.
+        
+        Args:
+            file: Path to a CSV file, DataFrame, or file-like object containing CSV data
+            filename (str, optional): Name for the file in Vena
+            
+        Returns:
+            Dict[str, Tuple[str, Any, str]]: The ``file`` and ``metadata`` parts as
+                (filename, content, content type) tuples
+            
+        Raises:
+            ValueError: If file is invalid or empty
+        """
+        # Handle different input types
+        if isinstance(file, str):
+            # File path
+            if not os.path.exists(file):
+                raise ValueError(f"File not found: {file}")
+            if os.path.getsize(file) == 0:
+                raise ValueError("File is empty")
+            # Pass the open handle so the upload streams from disk; closed by _close_upload_files
+            file_content = open(file, 'rb')
+            if not filename:
+                filename = os.path.basename(file)
+
+        elif isinstance(file, pd.DataFrame):
+            # DataFrame
+            if len(file.index) == 0 or len(file.columns) == 0:
+                raise ValueError("DataFrame is empty")
+            file_content = self._dataframe_to_csv_buffer(file)
+            if not filename:
+                filename = f"data_upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+        elif hasattr(file, 'read'):
+            # File-like object
+            file_content = file.read()
+            if isinstance(file_content, str):
+                file_content = file_content.encode('utf-8')
+            if not filename:
+                filename = f"data_upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+        else:
+            raise ValueError("Invalid file type. Must be file path, DataFrame, or file-like object")
+
+        # Validate file content (a non-empty DataFrame always yields at least a header row)
+        if isinstance(file_content, bytes) and not file_content.strip():
+            raise ValueError("File is empty")
+
+        # Create metadata JSON with required fields
+        metadata = {
+            "input": {
+                "partName": "file",
+                "fileFormat": "CSV",
+                "fileEncoding": "UTF-8",
+                "fileName": filename
+            }
+        }
+
+        # Create multipart form data with proper encoding
+        files = {
+            'file': (  # This key must match the partName in metadata
+                filename,
+                file_content,
+                'text/csv; charset=utf-8'
+            ),
+            'metadata': (
+                'metadata.json',
+                self._dumps(metadata),
+                'application/json'
+            )
+        }
+
+        return files
+
+    @staticmethod
+    def _close_upload_files(files: Dict[str, Tuple[str, Any, str]]) -> None:
+        """
+        Close the file handle or buffer opened by _build_upload_files, if any.
+        
+        Args:
+            files (Dict[str, Tuple[str, Any, str]]): Parts returned by _build_upload_files
+        """
+        content = files['file'][1]
+        if hasattr(content, 'close'):
+            content.close()
+
+    @classmethod
+    def _loads_response(cls, response: Any) -> Any:
+        """
+        Decode a JSON response body through _loads.
+        
+        Like ``response.json()``, a body that is not valid JSON raises a requests
+        exception, so callers that handle RequestException also handle it.
+        
+        Args:
+            response: requests response whose body should be JSON
+            
+        Returns:
+            Any: Decoded object
+            
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON
+                (httpx.DecodingError in AsyncVenaETL, see _json_error)
+        """
+        try:
+            return cls._loads(response.content)
+        except ValueError as e:
+            raise cls._json_error(response, e) from e
+
+    @staticmethod
+    def _json_error(response: Any, error: ValueError) -> Exception:
+        """
+        Build the exception raised when a response body is not valid JSON.
+        
+        Args:
+            response: requests response whose body failed to decode
+            error (ValueError): Error raised by the JSON decoder
+            
+        Returns:
+            Exception: requests.exceptions.JSONDecodeError describing the failure
+        """
+        if isinstance(error, json.JSONDecodeError):
+            return requests.exceptions.JSONDecodeError(error.msg, error.doc, error.pos)
+        return requests.exceptions.JSONDecodeError(str(error), '', 0)
+
+    @classmethod
+    def _parse_status(cls, response: Any) -> Any:
+        """
+        Decode a job status response body.
+        
+        The status endpoint normally returns a bare JSON string such as ``"RUNNING"``,
+        which is unquoted directly instead of going through a JSON decoder.
+        
+        Args:
+            response: requests or httpx response from the status endpoint
+            
+        Returns:
+            Any: The status string, or the decoded JSON for any other payload
+        """
+        raw = response.content.strip()
+        if len(raw) >= 2 and raw[:1] == b'"' and raw[-1:] == b'"' and b'\\' not in raw:
+            return raw[1:-1].decode('utf-8')
+        return cls._loads_response(response)
+
+    @staticmethod
+    def _retry_after(response: Any) -> Optional[float]:
+        """
+        Read a delay in seconds from the response's Retry-After header, if any.
+        
+        Args:
+            response: requests or httpx response to inspect
+            
+        Returns:
+            Optional[float]: Server-suggested delay, or None if absent or not numeric
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _rows_to_dataframe(rows: np.ndarray, headers: List[str]) -> pd.DataFrame:
+        """
+        Build a DataFrame from a 2D object array of exported rows.
+        
+        Columns are handed to pandas one by one as views of ``rows``, so each
+        column's dtype is inferred on its own without first consolidating the
+        whole frame into a single object block.
+        
+        Args:
+            rows (np.ndarray): Data rows
+            headers (List[str]): Column names
+            
+        Returns:
+            pd.DataFrame: DataFrame with the numeric dtypes the row-list constructor would infer
+        """
+        if len(set(headers)) != len(headers):
+            # A dict would collapse repeated column names
+            return pd.DataFrame(rows, columns=headers, copy=False).infer_objects()
+        return pd.DataFrame(dict(zip(headers, rows.T)), columns=headers, copy=False).infer_objects()
+
+    def _encode_data_body(self, json_data: Union[pd.DataFrame, np.ndarray, List[List[Any]]], validated: bool = False) -> bytes:
+        """
+        Build the JSON request body for a startWithData call.
+        
+        When ``compress_uploads`` is enabled the body is gzip-compressed and must be
+        sent with the headers in ``_data_headers``.
+        
+        Args:
+            json_data (Union[pd.DataFrame, np.ndarray, List[List[Any]]]): Data to import
+            validated (bool): Skip DataFrame validation because the caller already did it
+            
+        Returns:
+            bytes: Serialized request body
         """
         if isinstance(json_data, pd.DataFrame):
-            json_data = self._convert_dataframe_to_array(json_data)
+            body = b'{"input":{"data":' + self._dataframe_to_json(json_data, validated) + b'}}'
+        else:
+            body = self._dumps({"input": {"data": json_data}})
+        if self.compress_uploads:
+            # Level 6 compresses tabular JSON almost as well as 9 in a fraction of the time
+            body = gzip.compress(body, compresslevel=6)
+        return body
+
+    def _encode_job_data_body(self, data: Union[pd.DataFrame, List[Dict[str, Any]]]) -> bytes:
+        """
+        Build the JSON request body for uploading data to a job.
+        
+        DataFrames are written as records by pandas' C JSON writer instead of
+        first materializing one Python dict per row, as long as that reproduces
+        every value exactly (see _to_json_is_exact).
+        
+        Args:
+            data (Union[pd.DataFrame, List[Dict[str, Any]]]): The data to upload
+            
+        Returns:
+            bytes: Serialized request body
+        """
+        if isinstance(data, pd.DataFrame):
+            # to_json rejects repeated column names for records
+            if data.columns.is_unique and self._to_json_is_exact(data):
+                records = data.to_json(orient='records', double_precision=15, date_format='iso', date_unit='ns',
+                                       force_ascii=False)
+                return b'{"data":' + records.encode('utf-8') + b'}'
+            # Like to_dict('records'), a repeated column name keeps its last value
+            names = [str(name) for name in data.columns]
+            data = [dict(zip(names, row)) for row in zip(*self._json_columns(data))]
+        return self._dumps({"data": data})
+
+    def _job_url(self, job_id: str, suffix: str = "") -> str:
+        """
+        Build the URL of a job endpoint.
+        
+        Args:
+            job_id (str): The ID of the job
+            suffix (str, optional): Sub-resource such as ``submit`` or ``cancel``
+            
+        Returns:
+            str: URL of the job, or of the given sub-resource of the job
+        """
+        if suffix:
+            return f"{self.job_status_url}/{job_id}/{suffix}"
+        return f"{self.job_status_url}/{job_id}"
+
+    @classmethod
+    def _extract_error(cls, source: Any) -> str:
+        """
+        Describe a failed request, preferring the JSON error body over raw text.
+        
+        Args:
+            source: requests or httpx response, or an exception that may carry one
             
+        Returns:
+            str: ``Error details: ...`` for JSON bodies, ``Error response: ...`` for other
+                bodies, or the exception message when there is no response
+        """
+        response = getattr(source, 'response', None) if isinstance(source, Exception) else source
+        if response is None:
+            return str(source)
         try:
-            body = {"input": {"data": json_data}}
-            response = requests.post(
-                self.start_with_data_url,
-                json=body,
-                auth=(self.api_user, self.api_key),
-                headers=self.headers
-            )
-            response.raise_for_status()
-            job_id = response.json()['id']
+            return f"Error details: {cls._loads(response.content)}"
+        except ValueError:
+            return f"Error response: {response.text}"
+
+    @staticmethod
+    def _status_error_details(payload: Any) -> str:
+        """
+        Describe why a job failed from its status payload, when the payload says so.
+        
+        Args:
+            payload: Decoded status response, either a bare status string or a job object
+            
+        Returns:
+            str: Details prefixed with a newline, or an empty string if the payload
+                carries no ``error`` or ``message``
+        """
+        if isinstance(payload, dict):
+            if payload.get('error'):
+                return f"\nError details: {payload['error']}"
+            if payload.get('message'):
+                return f"\nError message: {payload['message']}"
+        return ""
+
+    @staticmethod
+    def _partial_import_message(failed: int, total: int, job_ids: List[str], not_cancelled: List[str]) -> str:
+        """
+        Describe a chunked import in which only some of the jobs could be started.
+        
+        Args:
+            failed (int): Number of chunks whose job failed to start
+            total (int): Number of chunks in the import
+            job_ids (List[str]): IDs of the jobs that did start
+            not_cancelled (List[str]): IDs of started jobs whose cancellation failed
+            
+        Returns:
+            str: Error message naming the started jobs
+        """
+        message = f"Failed to start {failed} of {total} ETL jobs; cancelled started jobs: {job_ids}"
+        if not_cancelled:
+            message += f" (cancellation failed for: {not_cancelled})"
+        return message
+
+    @classmethod
+    def _job_error_details(cls, response: Any) -> str:
+        """
+        Describe why a job failed from its job details response.
+        
+        Args:
+            response: requests or httpx response from the job details endpoint
+            
+        Returns:
+            str: Details prefixed with a newline, or an empty string if none are available
+        """
+        error_details = ""
+        if response.status_code == 200:
+            try:
+                error_data = cls._loads(response.content)
+                if 'error' in error_data:
+                    error_details = f"\nError details: {error_data['error']}"
+                elif 'message' in error_data:
+                    error_details = f"\nError message: {error_data['message']}"
+                elif isinstance(error_data, dict):
+                    error_details = f"\nError response: {error_data}"
+            except (ValueError, TypeError):
+                error_details = f"\nError response: {response.text}"
+        return error_details
+
+    @staticmethod
+    def _split_export_page(data_response: Dict[str, Any]) -> Tuple[np.ndarray, Optional[str]]:
+        """
+        Extract the data rows and next page URL from a decoded intersections page.
+        
+        Args:
+            data_response (Dict[str, Any]): Decoded page; its ``data`` list is released
+            
+        Returns:
+            Tuple[np.ndarray, Optional[str]]: The page's data rows as a 2D object array,
+                and the URL of the next page if there is one
+        """
+        metadata = data_response['metadata']
+        # Keep each page as one object array, so the decoded row lists can be released
+        # page by page. Every page starts with a header row; it is skipped with an array
+        # view rather than copying the row list with data[1:]
+        data = data_response.pop('data')
+        if len(data) > 1:
+            page = np.asarray(data, dtype=object)[1:]
+        else:
+            page = np.empty((0, len(metadata['headers'])), dtype=object)
+        return page, metadata.get('nextPage')
+
+    @staticmethod
+    def _remaining_page_urls(metadata: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Build the URLs of every page after the first, if the page metadata allows it.
+        
+        This needs a total page count (``totalPages``, or ``totalCount`` with
+        ``pageSize``) and a ``nextPage`` link carrying a numeric ``page`` or
+        ``pageNumber`` query parameter. Otherwise pages can only be reached by
+        following ``nextPage`` cursors one at a time.
+        
+        Args:
+            metadata (Dict[str, Any]): Metadata of the first page
+            
+        Returns:
+            Optional[List[str]]: URLs of the remaining pages in order, or None if they
+                cannot be derived
+        """
+        next_page = metadata.get('nextPage')
+        if not next_page:
+            return None
+
+        try:
+            total_pages = metadata.get('totalPages')
+            if total_pages is None and metadata.get('totalCount') is not None and metadata.get('pageSize'):
+                total_pages = -(-int(metadata['totalCount']) // int(metadata['pageSize']))
+            if total_pages is None:
+                return None
+            total_pages = int(total_pages)
+        except (TypeError, ValueError):
+            return None
+
+        parts = urlsplit(next_page)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        for index, (key, value) in enumerate(query):
+            if key in ('page', 'pageNumber') and value.isdigit():
+                break
+        else:
+            return None
+
+        # The first page has already been fetched, so total_pages - 1 remain,
+        # numbered from whatever index the next link uses
+        start = int(value)
+        urls = []
+        for number in range(start, start + total_pages - 1):
+            query[index] = (key, str(number))
+            urls.append(urlunsplit(parts._replace(query=urlencode(query))))
+        return urls
+
+    def _load_page(self, response: Any, parser: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Decode one intersections page.
+        
+        With a simdjson parser only the ``data`` and ``metadata`` fields are
+        materialized; otherwise the page is decoded with _loads_response.
+        
+        Args:
+            response: requests or httpx response holding the page
+            parser (simdjson.Parser, optional): Parser owned by the calling thread
+            
+        Returns:
+            Dict[str, Any]: Page with ``data`` and ``metadata`` keys
+            
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON
+                (httpx.DecodingError in AsyncVenaETL)
+        """
+        if parser is None:
+            return self._loads_response(response)
+
+        try:
+            doc = parser.parse(response.content)
+        except ValueError as e:
+            raise self._json_error(response, e) from e
+        try:
+            return {'data': doc['data'].as_list(), 'metadata': doc['metadata'].as_dict()}
+        finally:
+            # The parser can only be reused once no proxy objects reference it
+            del doc
+
+class VenaETL(_BaseVenaETL):
+    """
+    Client for interacting with Vena's ETL API.
+    
+    This class provides methods for:
+    - Data import and export
+    - Job creation and management
+    - Job status monitoring
+    - Job cancellation
+    
+    Attributes:
+        hub (str): Data center hub (e.g., us1, us2, ca3)
+        api_user (str): API user from Vena authentication token
+        api_key (str): API key from Vena authentication token
+        template_id (str): ETL template ID
+        data_source (str): Please indicate the ERP or data source, this helps Vena with support and troubleshooting.(e.g., NetSuite, Dynamics 365, SAP, ADP, Other) 
+        model_id (str, optional): Model ID for export operations
+    """
+    
+    def __init__(self, hub: str, api_user: str, api_key: str, template_id: str, data_source: str, model_id: Optional[str] = None, compress_uploads: bool = False):
+        """
+        Initialize the Vena ETL client.
+        
+        Args:
+            hub (str): Data center hub (e.g., us1, us2, ca3)
+            api_user (str): API user from Vena authentication token
+            api_key (str): API key from Vena authentication token
+            template_id (str): ETL template ID
+            data_source (str): Please indicate the ERP or data source, this helps Vena with support and troubleshooting.(e.g., NetSuite, Dynamics 365, SAP, ADP, Other)
+            model_id (str, optional): Model ID for export operations
+            compress_uploads (bool): Gzip-compress startWithData request bodies (default: False)
+
+        """
+        super().__init__(hub, api_user, api_key, template_id, data_source, model_id, compress_uploads)
+
+        # Shared session so every call reuses pooled keep-alive connections
+        # instead of paying a fresh TCP/TLS handshake per request
+        self._session = requests.Session()
+        self._session.auth = _PrecomputedBasicAuth(api_user, api_key)
+        self._session.headers.update(self.headers)
+        # Retry transient failures on idempotent requests only: a POST that times
+        # out or gets a 5xx may already have started a job, and repeating it would
+        # import the same data twice. Connection errors are retried for every
+        # method because the request never reached the server.
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self) -> "VenaETL":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def start_with_data(self, json_data: Union[pd.DataFrame, np.ndarray, List[List[Any]]]) -> None:
+        """
+        Starts an ETL job with the provided JSON data and checks job status before completing.
+        
+        Args:
+            json_data (Union[pd.DataFrame, np.ndarray, List[List[Any]]]): Data to import, either as a DataFrame,
+                a 2D NumPy array (requires orjson) or array of arrays
+        """
+        try:
+            job_id = self._submit_data(json_data)
         except requests.exceptions.RequestException as e:
-            print(f"Failed to start ETL job: {e}", file=sys.stderr)
+            _log.error("Failed to start ETL job: %s", e)
             return
 
-        self._monitor_job_status(job_id)
+        self._wait_for_job(job_id)
 
-    def _dataframe_to_csv_string(self, df: pd.DataFrame) -> str:
+    def _submit_data(self, json_data: Union[pd.DataFrame, np.ndarray, List[List[Any]]], validated: bool = False) -> str:
         """
-        Convert a DataFrame to a CSV string in the format required by Vena.
+        Start an ETL job with the provided data without waiting for it to finish.
         
         Args:
-            df (pd.DataFrame): The DataFrame to convert
+            json_data (Union[pd.DataFrame, np.ndarray, List[List[Any]]]): Data to import
+            validated (bool): Skip DataFrame validation because the caller already did it
             
         Returns:
-            str: CSV string in the required format
+            str: ID of the started job
+            
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
         """
-        # Ensure all columns are strings
-        df = df.astype(str)
-        
-        # Create CSV string
-        output = StringIO()
-        df.to_csv(output, index=False, header=True)
-        return output.getvalue()
+        body = self._encode_data_body(json_data, validated)
+        response = self._session.post(self.start_with_data_url, data=body, headers=self._data_headers)
+        response.raise_for_status()
+        return self._loads_response(response)['id']
 
-    def start_with_file(self, file: Union[str, pd.DataFrame, TextIO], filename: str = None) -> str:
+    def start_with_file(self, file: Union[str, pd.DataFrame, TextIO, BinaryIO], filename: str = None) -> str:
         """
         Start an ETL job using a file or DataFrame.
         
@@ -197,7 +945,7 @@ class VenaETL:
             file: Can be one of:
                 - str: Path to a CSV file
                 - pd.DataFrame: DataFrame to convert to CSV
-                - TextIO: File-like object containing CSV data
+                - TextIO/BinaryIO: File-like object containing CSV data
             filename (str, optional): Name for the file in Vena. If not provided,
                 will use the input filename or generate a default name.
             
@@ -209,187 +957,212 @@ class VenaETL:
             requests.exceptions.RequestException: If API request fails
         """
         try:
-            # Handle different input types
-            if isinstance(file, str):
-                # File path
-                if not os.path.exists(file):
-                    raise ValueError(f"File not found: {file}")
-                with open(file, 'r') as f:
-                    file_content = f.read()
-                if not filename:
-                    filename = os.path.basename(file)
-            
-            elif isinstance(file, pd.DataFrame):
-                # DataFrame
-                if file.empty:
-                    raise ValueError("DataFrame is empty")
-                file_content = self._dataframe_to_csv_string(file)
-                if not filename:
-                    filename = f"data_upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            
-            elif hasattr(file, 'read'):
-                # File-like object
-                file_content = file.read()
-                if not filename:
-                    filename = f"data_upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            
-            else:
-                raise ValueError("Invalid file type. Must be file path, DataFrame, or file-like object")
-
-            # Validate file content
-            if not file_content.strip():
-                raise ValueError("File is empty")
-
-            # Prepare the request
+            files = self._build_upload_files(file, filename)
             url = self.start_with_file_url
             
-            # Create metadata JSON with required fields
-            metadata = {
-                "input": {
-                    "partName": "file",
-                    "fileFormat": "CSV",
-                    "fileEncoding": "UTF-8",
-                    "fileName": filename
-                }
-            }
-            
-            # Create multipart form data with proper encoding
-            files = {
-                'file': (  # This key must match the partName in metadata
-                    filename,
-                    file_content.encode('utf-8'),
-                    'text/csv; charset=utf-8'
-                ),
-                'metadata': (
-                    'metadata.json',
-                    json.dumps(metadata).encode('utf-8'),
-                    'application/json'
-                )
-            }
-            
-            # Make the request with proper authentication and headers
-            response = requests.post(
-                url,
-                files=files,
-                auth=(self.api_user, self.api_key),
-                headers={
-                    "accept": "application/json"
-                }
-            )
+            try:
+                if MultipartEncoder is not None:
+                    # Stream the multipart body to the socket instead of building it in memory
+                    encoder = MultipartEncoder(fields=files)
+                    response = self._session.post(
+                        url,
+                        data=encoder,
+                        headers={"content-type": encoder.content_type}
+                    )
+                else:
+                    # Drop the session's JSON content-type so requests can set the
+                    # multipart boundary itself
+                    response = self._session.post(
+                        url,
+                        files=files,
+                        headers={"content-type": None}
+                    )
+            finally:
+                self._close_upload_files(files)
             
             # Check for error response
             if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    error_msg = f"Error details: {error_data}"
-                except:
-                    error_msg = f"Error response: {response.text}"
-                raise requests.exceptions.RequestException(error_msg)
+                raise requests.exceptions.RequestException(self._extract_error(response))
             
             response.raise_for_status()
             
             # Extract and return job ID
-            job_id = response.json().get('id')
+            job_id = self._loads_response(response).get('id')
             if not job_id:
                 raise ValueError("No job ID received from Vena API")
             
-            print(f"ETL job started with ID: {job_id}")
+            _log.info("ETL job started with ID: %s", job_id)
             
             # Monitor the job status
-            self._monitor_job_status(job_id)
+            self._wait_for_job(job_id)
             
             return job_id
             
         except requests.exceptions.RequestException as e:
             error_msg = str(e)
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_detail = e.response.json()
-                    error_msg = f"{error_msg}\nDetails: {error_detail}"
-                except:
-                    pass
-            print(f"Error starting ETL job: {error_msg}")
+            if getattr(e, 'response', None) is not None:
+                error_msg = f"{error_msg}\n{self._extract_error(e)}"
+            _log.error("Error starting ETL job: %s", error_msg)
             raise
 
-    def _monitor_job_status(self, job_id: str) -> None:
+    def _wait_for_job(self, job_id: str, initial: float = 0.1, factor: float = 1.5, cap: float = 30.0) -> None:
         """
-        Monitor the status of an ETL job.
+        Wait for an ETL job to finish, polling its status with exponential backoff.
         
         Args:
             job_id (str): ID of the job to monitor
+            initial (float): Delay before the second status check (in seconds)
+            factor (float): Multiplier applied to the delay after each poll
+            cap (float): Maximum delay between polls (in seconds)
+            
+        Raises:
+            Exception: If the job ends in ERROR or CANCELLED, or its status cannot be read
         """
-        check_status_url = f'{self.base_url}/etl/jobs/{job_id}/status'
-        time.sleep(1)
+        self._wait_for_jobs([job_id], initial, factor, cap)
 
-        while True:
-            try:
-                status_response = requests.get(
-                    url=check_status_url,
-                    auth=(self.api_user, self.api_key),
-                    headers=self.headers
-                )
-                status_response.raise_for_status()
-                job_status = status_response.json()
-
-                if job_status == "COMPLETED":
-                    print(f"Job {job_id} completed successfully.")
-                    break
-                elif job_status in ["ERROR", "CANCELLED"]:
-                    # Get error details if available
-                    error_url = f'{self.base_url}/etl/jobs/{job_id}'
-                    error_response = requests.get(
-                        url=error_url,
-                        auth=(self.api_user, self.api_key),
-                        headers=self.headers
-                    )
-                    
-                    error_details = ""
-                    if error_response.status_code == 200:
-                        try:
-                            error_data = error_response.json()
-                            if 'error' in error_data:
-                                error_details = f"\nError details: {error_data['error']}"
-                            elif 'message' in error_data:
-                                error_details = f"\nError message: {error_data['message']}"
-                            elif isinstance(error_data, dict):
-                                error_details = f"\nError response: {error_data}"
-                        except:
-                            error_details = f"\nError response: {error_response.text}"
-                    
-                    print(f"Job {job_id} ended with status: {job_status}{error_details}", file=sys.stderr)
-                    raise Exception(f"Job failed with status: {job_status}{error_details}")
-                else:
-                    print(f"Job {job_id} status: {job_status}")
-            except requests.exceptions.RequestException as e:
-                error_msg = str(e)
-                if hasattr(e, 'response') and e.response is not None:
-                    try:
-                        error_data = e.response.json()
-                        error_msg = f"Error details: {error_data}"
-                    except:
-                        error_msg = f"Error response: {e.response.text}"
-                print(f"Error checking job status: {error_msg}", file=sys.stderr)
-                raise Exception(f"Failed to check job status: {error_msg}")
+    def _wait_for_jobs(self, job_ids: List[str], initial: float = 0.1, factor: float = 1.5, cap: float = 30.0) -> None:
+        """
+        Wait for several ETL jobs to finish, polling all outstanding jobs on each tick.
+        
+        The first round runs immediately. The delay between rounds then starts at
+        ``initial`` and grows by ``factor`` up to ``cap`` seconds, so one sleep is
+        shared by every job still running. The delay drops back to ``initial``
+        whenever a job moves to a new status. A Retry-After header on any status
+        response takes precedence.
+        
+        Args:
+            job_ids (List[str]): IDs of the jobs to monitor
+            initial (float): Delay before the second round of status checks (in seconds)
+            factor (float): Multiplier applied to the delay after each round
+            cap (float): Maximum delay between rounds (in seconds)
+            
+        Raises:
+            Exception: If any job ends in ERROR or CANCELLED, or its status cannot be read
+        """
+        pending = list(job_ids)
+        delay = initial
+        last_status = {}
+
+        while pending:
+            retry_after = None
+            transitioned = False
+            still_running = []
+            for job_id in pending:
+                try:
+                    status_response = self._session.get(self._status_url_fmt % job_id)
+                    status_response.raise_for_status()
+                    payload = self._parse_status(status_response)
+                    job_status = payload.get('status') if isinstance(payload, dict) else payload
+
+                    if job_status == "COMPLETED":
+                        _log.info("Job %s completed successfully.", job_id)
+                        continue
+                    elif job_status in ["ERROR", "CANCELLED"]:
+                        # Only fetch the full job when the status response has no error details
+                        error_details = self._status_error_details(payload)
+                        if not error_details:
+                            error_response = self._session.get(self._job_url(job_id))
+                            error_details = self._job_error_details(error_response)
+                        
+                        _log.error("Job %s ended with status: %s%s", job_id, job_status, error_details)
+                        raise Exception(f"Job failed with status: {job_status}{error_details}")
+                    else:
+                        _log.debug("Job %s status: %s", job_id, job_status)
+                        if last_status.get(job_id, job_status) != job_status:
+                            transitioned = True
+                        last_status[job_id] = job_status
+                        still_running.append(job_id)
+                except requests.exceptions.RequestException as e:
+                    error_msg = self._extract_error(e)
+                    _log.error("Error checking job status: %s", error_msg)
+                    raise Exception(f"Failed to check job status: {error_msg}")
+
+                hint = self._retry_after(status_response)
+                if hint is not None:
+                    retry_after = hint if retry_after is None else max(retry_after, hint)
+
+            pending = still_running
+            if not pending:
+                break
 
-            time.sleep(3)
+            if retry_after is not None:
+                time.sleep(retry_after)
+            else:
+                if transitioned:
+                    delay = initial
+                time.sleep(delay)
+                delay = min(delay * factor, cap)
 
-    def import_dataframe(self, df: pd.DataFrame) -> None:
+    def import_dataframe(self, df: pd.DataFrame, chunk_size: Optional[int] = None, max_workers: int = 4) -> None:
         """
         Import data from a pandas DataFrame.
         
+        By default the frame is imported as a single ETL job. When ``chunk_size`` is
+        given, frames larger than ``chunk_size`` rows are split into row chunks that
+        are submitted concurrently as separate ETL jobs, then all jobs are monitored
+        together. If only some of the chunks could be started, the jobs that did
+        start are cancelled and an exception naming them is raised.
+        
         Args:
             df (pd.DataFrame): The DataFrame containing the data to import
+            chunk_size (Optional[int]): Maximum number of rows per ETL job, or None to
+                import the whole frame as one job (default: None)
+            max_workers (int): Maximum number of chunks uploaded at the same time (default: 4)
+            
+        Raises:
+            Exception: If some chunks failed to start; the message lists the started job IDs
         """
         self._validate_dataframe(df)
-        self.start_with_data(df)
-        print("Data Import Script Finished")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        if chunk_size is None or len(df) <= chunk_size:
+            try:
+                job_ids = [self._submit_data(df, validated=True)]
+            except requests.exceptions.RequestException as e:
+                _log.error("Failed to start ETL job: %s", e)
+                return
+        else:
+            # Every chunk is a non-empty row slice of the validated frame
+            chunks = [df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size)]
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                futures = [executor.submit(self._submit_data, chunk, True) for chunk in chunks]
+            job_ids = []
+            errors = []
+            for future in futures:
+                try:
+                    job_ids.append(future.result())
+                except Exception as e:
+                    errors.append(e)
+            if errors:
+                _log.error("Failed to start %d of %d ETL jobs: %s", len(errors), len(chunks), errors[0])
+                if not job_ids:
+                    # Nothing to roll back; only request failures are logged and swallowed
+                    for e in errors:
+                        if not isinstance(e, requests.exceptions.RequestException):
+                            raise e
+                    return
+                not_cancelled = []
+                for job_id in job_ids:
+                    try:
+                        self.cancel_job(job_id)
+                    except Exception as e:
+                        _log.error("Failed to cancel job %s: %s", job_id, e)
+                        not_cancelled.append(job_id)
+                raise Exception(self._partial_import_message(len(errors), len(chunks), job_ids, not_cancelled)) from errors[0]
+            _log.info("Started %d ETL jobs: %s", len(job_ids), job_ids)
 
-    def export_data(self, page_size: int = 100000) -> Optional[pd.DataFrame]:
+        self._wait_for_jobs(job_ids)
+        _log.info("Data Import Script Finished")
+
+    def export_data(self, page_size: int = 100000, max_workers: int = 8) -> Optional[pd.DataFrame]:
         """
         Export intersections data from the Vena model with pagination support.
         
         Args:
             page_size (int): Number of records to fetch per page (default: 5000, max: 100000)
+            max_workers (int): Maximum number of pages fetched at the same time when the
+                API reports the total page count (default: 8)
             
         Returns:
             Optional[pd.DataFrame]: DataFrame containing all intersections data, or None if there was an error
@@ -398,44 +1171,234 @@ class VenaETL:
             raise ValueError("Model ID must be set to export data")
             
         try:
-            all_data = []
-            next_page_url = f"{self.intersections_url}?pageSize={page_size}"
-            
-            while next_page_url:
-                # Make API request to get intersections data
-                response = requests.get(
-                    next_page_url,
-                    auth=(self.api_user, self.api_key),
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                
-                # Load response into json
-                data_response = response.json()
-                
-                # Skip the header row in data array and add the rest
-                all_data.extend(data_response['data'][1:])  # Skip the first row which contains headers
+            pages = []
+            headers = []
+            record_count = 0
+            
+            for headers, rows, next_page_url in self._iter_export_pages(page_size, max_workers):
+                pages.append(rows)
+                record_count += len(rows)
                 
                 # Check if there's a next page
-                next_page_url = data_response['metadata'].get('nextPage')
-                
-                # If there's a next page, use that URL directly
                 if next_page_url:
-                    print(f"Fetching next page... ({len(all_data)} records so far)")
-            
-            # Convert all data to DataFrame
-            intersections_df = pd.DataFrame(all_data)
+                    _log.debug("Fetching next page... (%d records so far)", record_count)
             
-            # Set column names from metadata headers
-            intersections_df.columns = data_response['metadata']['headers']
+            # Build the DataFrame once from all pages, with column names from metadata headers
+            if pages:
+                full = pages[0] if len(pages) == 1 else np.concatenate(pages, axis=0)
+                del pages
+                intersections_df = self._rows_to_dataframe(full, headers)
+            else:
+                intersections_df = pd.DataFrame(columns=headers)
             
-            print(f"Total records fetched: {len(intersections_df)}")
+            _log.info("Total records fetched: %d", len(intersections_df))
             return intersections_df
             
         except requests.exceptions.RequestException as e:
-            print(f"Failed to export data: {e}", file=sys.stderr)
+            _log.error("Failed to export data: %s", e)
             return None 
 
+    def iter_export(self, page_size: int = 100000, max_workers: int = 8) -> Iterator[pd.DataFrame]:
+        """
+        Export intersections data from the Vena model one page at a time.
+        
+        Unlike export_data, the whole model is never held in memory: besides the
+        current page, at most ``max_workers + 3`` decoded pages are buffered ahead
+        (pass ``max_workers=1`` to fetch pages one at a time). The first page is
+        available as soon as it arrives, which suits chunked downstream processing
+        of large models.
+        
+        Args:
+            page_size (int): Number of records to fetch per page (default: 100000, max: 100000)
+            max_workers (int): Maximum number of pages fetched at the same time when the
+                API reports the total page count (default: 8)
+            
+        Yields:
+            pd.DataFrame: Intersections data for one page
+            
+        Raises:
+            ValueError: If model_id is not set
+            requests.exceptions.RequestException: If fetching a page fails
+        """
+        if not self.model_id:
+            raise ValueError("Model ID must be set to export data")
+
+        for headers, rows, _ in self._iter_export_pages(page_size, max_workers):
+            if len(rows):
+                yield self._rows_to_dataframe(rows, headers)
+
+    def _iter_export_pages(self, page_size: int, max_workers: int = 8) -> Iterator[Tuple[List[str], np.ndarray, Optional[str]]]:
+        """
+        Yield the rows of each intersections page as a 2D object array.
+        
+        Args:
+            page_size (int): Number of records to fetch per page
+            max_workers (int): Maximum number of pages fetched at the same time
+            
+        Yields:
+            Tuple[List[str], np.ndarray, Optional[str]]: Column headers (taken from the first
+                page), the page's data rows, and the URL of the next page if there is one
+        """
+        headers = None
+        first_page_url = f"{self.intersections_url}?pageSize={page_size}"
+        
+        # A background thread fetches and decodes pages ahead of the caller: up to
+        # max_workers at once when the total page count is known (see _iter_pages)
+        for data_response in self._iter_pages(first_page_url, max_workers=max_workers):
+            # Column names come from the first page; later pages repeat them
+            if headers is None:
+                headers = data_response['metadata']['headers']
+            
+            yield (headers,) + self._split_export_page(data_response)
+
+    def _iter_pages(self, url: str, prefetch: int = 2, max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+        """
+        Yield decoded pages by following ``metadata.nextPage`` links from ``url``.
+        
+        A background thread fetches and decodes up to ``prefetch`` pages ahead, so the
+        network wait for the next page overlaps the caller's processing of the current one.
+        When the first page reports the total page count, the remaining pages are
+        fetched concurrently by up to ``max_workers`` threads instead.
+        
+        Args:
+            url (str): URL of the first page
+            prefetch (int): Maximum number of decoded pages buffered ahead of the caller
+            max_workers (int): Maximum number of pages fetched at the same time
+            
+        Yields:
+            Dict[str, Any]: Decoded page with ``data`` and ``metadata`` keys
+            
+        Raises:
+            requests.exceptions.RequestException: If fetching a page fails
+        """
+        buffered = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            # Give up once the consumer has gone away instead of blocking forever
+            while not stop.is_set():
+                try:
+                    buffered.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce():
+            next_page_url = url
+            # simdjson parsers are not thread-safe, so each producer gets its own
+            parser = simdjson.Parser() if simdjson is not None else None
+            try:
+                page_urls = None
+                while next_page_url and not stop.is_set():
+                    page = self._fetch_page(next_page_url, parser)
+                    if page_urls is None:
+                        page_urls = self._remaining_page_urls(page['metadata']) or []
+                    next_page_url = page['metadata'].get('nextPage')
+                    put(page)
+
+                    if page_urls and max_workers > 1:
+                        for page in self._fetch_pages(page_urls, max_workers, stop):
+                            put(page)
+                        page_urls = []
+                        # Keep following links if the server reported more pages than expected
+                        next_page_url = page['metadata'].get('nextPage')
+                put(done)
+            except Exception as e:
+                put(e)
+
+        threading.Thread(target=produce, name="vepi-page-prefetch", daemon=True).start()
+        try:
+            while True:
+                item = buffered.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    def _fetch_page(self, url: str, parser: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Fetch and decode one intersections page.
+        
+        When ijson's C backend is installed the body is parsed incrementally as it
+        streams in, so decoding overlaps the download and the raw page is never
+        buffered whole.
+        
+        Args:
+            url (str): URL of the page
+            parser (simdjson.Parser, optional): Parser owned by the calling thread
+            
+        Returns:
+            Dict[str, Any]: Decoded page with ``data`` and ``metadata`` keys
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        if ijson is not None:
+            with self._session.get(url, stream=True) as response:
+                response.raise_for_status()
+                # Let urllib3 undo gzip/br so ijson sees plain JSON
+                response.raw.decode_content = True
+                # Reading raw bypasses requests' own wrapping of urllib3 errors
+                try:
+                    return dict(ijson.kvitems(response.raw, '', use_float=True))
+                except ProtocolError as e:
+                    raise requests.exceptions.ChunkedEncodingError(e)
+                except ReadTimeoutError as e:
+                    raise requests.exceptions.ConnectionError(e)
+                except DecodeError as e:
+                    raise requests.exceptions.ContentDecodingError(e)
+                except ijson.JSONError as e:
+                    raise requests.exceptions.ChunkedEncodingError(f"Incomplete or invalid page body: {e}")
+
+        response = self._session.get(url)
+        response.raise_for_status()
+        return self._load_page(response, parser)
+
+    def _fetch_pages(self, urls: List[str], max_workers: int, stop: threading.Event) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch pages concurrently, yielding them decoded in the order of ``urls``.
+        
+        At most ``max_workers`` pages are requested ahead of the one being yielded,
+        which bounds memory when the consumer is slower than the network.
+        
+        Args:
+            urls (List[str]): Page URLs in order
+            max_workers (int): Number of fetching threads
+            stop (threading.Event): Set when the consumer no longer needs pages
+            
+        Yields:
+            Dict[str, Any]: Decoded page with ``data`` and ``metadata`` keys
+        """
+        local = threading.local()
+
+        def fetch(page_url):
+            parser = getattr(local, 'parser', None)
+            if parser is None and simdjson is not None:
+                parser = local.parser = simdjson.Parser()
+            return self._fetch_page(page_url, parser)
+
+        remaining = iter(urls)
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vepi-page") as executor:
+            try:
+                for page_url in remaining:
+                    in_flight.append(executor.submit(fetch, page_url))
+                    if len(in_flight) >= max_workers:
+                        break
+                while in_flight and not stop.is_set():
+                    page = in_flight.popleft().result()
+                    for page_url in remaining:
+                        in_flight.append(executor.submit(fetch, page_url))
+                        break
+                    yield page
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
     def get_dimension_hierarchy(self) -> pd.DataFrame:
         """
         Get the dimension hierarchies from the Vena model.
@@ -456,34 +1419,25 @@ class VenaETL:
             hierarchy_url = f'{self.base_url}/models/{self.model_id}/hierarchy'
             
             # Make the API request
-            response = requests.get(
-                hierarchy_url,
-                auth=(self.api_user, self.api_key),
-                headers=self.headers
-            )
+            response = self._session.get(hierarchy_url)
             response.raise_for_status()
             
             # Parse the response
-            data = response.json()
+            data = self._loads_response(response)
             
             # Convert to DataFrame
             df = pd.DataFrame(data['data'])
             
             # Print summary information
-            print(f"Retrieved {len(df)} dimension hierarchy members")
-            print("\nUnique dimensions:")
-            print(df['dimension'].unique())
+            _log.info("Retrieved %d dimension hierarchy members", len(df))
+            _log.info("Unique dimensions: %s", list(df['dimension'].unique()))
             
             return df
             
         except requests.exceptions.RequestException as e:
-            print(f"Failed to get dimension hierarchies: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    print(f"Error details: {error_data}", file=sys.stderr)
-                except:
-                    print(f"Error response: {e.response.text}", file=sys.stderr)
+            _log.error("Failed to get dimension hierarchies: %s", e)
+            if getattr(e, 'response', None) is not None:
+                _log.error("%s", self._extract_error(e))
             return None 
 
     def upload_job_data(self, job_id: str, data: Union[pd.DataFrame, List[Dict[str, Any]]]) -> Dict[str, Any]:
@@ -500,33 +1454,16 @@ class VenaETL:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"{self.job_status_url}/{job_id}/data"
-        
-        # Convert DataFrame to list of dictionaries if needed
-        if isinstance(data, pd.DataFrame):
-            data = data.to_dict('records')
-            
-        body = {
-            "data": data
-        }
+        url = self._job_url(job_id, "data")
         
         try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                auth=(self.api_user, self.api_key),
-                json=body
-            )
+            # The session already sends content-type: application/json
+            response = self._session.post(url, data=self._encode_job_data_body(data))
             response.raise_for_status()
-            return response.json()
+            return self._loads_response(response)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 422:
-                print(f"Error uploading data: {e.response.text}")
-                try:
-                    error_details = e.response.json()
-                    print(f"Error details: {error_details}")
-                except:
-                    pass
+                _log.error("Error uploading data: %s", self._extract_error(e))
             raise
 
     def create_job(self) -> str:
@@ -539,16 +1476,11 @@ class VenaETL:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"{self.base_url}/etl/templates/{self.template_id}/jobs"
-        response = requests.post(
-            url,
-            headers=self.headers,
-            auth=(self.api_user, self.api_key)
-        )
+        response = self._session.post(self.create_job_url)
         if response.status_code == 422:
-            print(f"Error response content: {response.text}")
+            _log.error("Error response content: %s", response.text)
         response.raise_for_status()
-        return response.json().get('id')
+        return self._loads_response(response).get('id')
 
     def submit_job(self, job_id: str) -> Dict[str, Any]:
         """
@@ -563,16 +1495,12 @@ class VenaETL:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"{self.job_status_url}/{job_id}/submit"
-        response = requests.post(
-            url, 
-            headers=self.headers, 
-            auth=(self.api_user, self.api_key)
-        )
+        url = self._job_url(job_id, "submit")
+        response = self._session.post(url)
         if response.status_code == 422:
-            print(f"Error response content: {response.text}")
+            _log.error("Error response content: %s", response.text)
         response.raise_for_status()
-        return response.json()
+        return self._loads_response(response)
 
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """
@@ -587,18 +1515,38 @@ class VenaETL:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"{self.job_status_url}/{job_id}"
-        response = requests.get(url, headers=self.headers, auth=(self.api_user, self.api_key))
+        return self._loads_response(self._get_job_status_response(job_id))
+
+    def _get_job_status_response(self, job_id: str) -> requests.Response:
+        """
+        Fetch the status of a job, returning the raw response so headers can be inspected.
+        
+        Args:
+            job_id (str): The ID of the job to check
+            
+        Returns:
+            requests.Response: The successful status response
+            
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        url = self._job_url(job_id)
+        response = self._session.get(url)
         response.raise_for_status()
-        return response.json()
+        return response
 
     def wait_for_job_completion(self, job_id: str, poll_interval: int = 5, timeout: int = 3600) -> Dict[str, Any]:
         """
-        Wait for a job to complete, polling its status at regular intervals.
+        Wait for a job to complete, polling its status with exponential backoff.
+        
+        The delay between polls starts at ``poll_interval``, grows by half after
+        each poll up to ``max(poll_interval * 10, 60)`` seconds, and resets
+        whenever the job changes status. A Retry-After header on the status
+        response takes precedence.
         
         Args:
             job_id (str): The ID of the job to monitor
-            poll_interval (int): How often to check the job status (in seconds)
+            poll_interval (int): Initial delay between status checks (in seconds)
             timeout (int): Maximum time to wait for completion (in seconds)
             
         Returns:
@@ -608,16 +1556,32 @@ class VenaETL:
             TimeoutError: If the job doesn't complete within the timeout period
             requests.exceptions.RequestException: If the API request fails
         """
+        cap = max(poll_interval * 10, 60)
+        delay = poll_interval
+        last_status = None
         start_time = time.time()
         while True:
-            status = self.get_job_status(job_id)
+            response = self._get_job_status_response(job_id)
+            status = self._loads_response(response)
             if status.get('status') in ['COMPLETED', 'FAILED']:
                 return status
                 
-            if time.time() - start_time > timeout:
+            elapsed = time.time() - start_time
+            if elapsed >= timeout:
                 raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
                 
-            time.sleep(poll_interval)
+            if last_status is not None and status.get('status') != last_status:
+                delay = poll_interval
+            last_status = status.get('status')
+
+            retry_after = self._retry_after(response)
+            if retry_after is not None:
+                wait = retry_after
+            else:
+                wait = delay
+                delay = min(delay * 1.5, cap)
+            # Never sleep past the deadline; the job is polled once more when it arrives
+            time.sleep(min(wait, timeout - elapsed))
 
     def process_data(self, data: Union[pd.DataFrame, List[Dict[str, Any]]], poll_interval: int = 5, timeout: int = 3600) -> Dict[str, Any]:
         """
@@ -671,32 +1635,32 @@ class VenaETL:
             requests.exceptions.RequestException: If any API request fails
             TimeoutError: If the job doesn't complete within the timeout period
         """
-        print("Creating job...")
+        _log.info("Creating job...")
         job_id = self.create_job()
         
         if not job_id:
             raise ValueError("Failed to create job")
             
-        print(f"Job created successfully with ID: {job_id}")
+        _log.info("Job created successfully with ID: %s", job_id)
         
         # Get initial job status
         initial_status = self.get_job_status(job_id)
-        print(f"Initial job status: {initial_status.get('status') if initial_status else 'Unknown'}")
+        _log.info("Initial job status: %s", initial_status.get('status') if initial_status else 'Unknown')
         
         # Submit the job
-        print("Submitting job...")
+        _log.info("Submitting job...")
         submit_result = self.submit_job(job_id)
-        print(f"Job submitted successfully: {submit_result}")
+        _log.info("Job submitted successfully: %s", submit_result)
         
         # Wait for completion
-        print("Waiting for job completion...")
+        _log.info("Waiting for job completion...")
         final_status = self.wait_for_job_completion(job_id, poll_interval, timeout)
-        print(f"Job completed with status: {final_status.get('status')}")
+        _log.info("Job completed with status: %s", final_status.get('status'))
         
         if final_status.get('error'):
-            print(f"Error: {final_status.get('error')}")
+            _log.error("Error: %s", final_status.get('error'))
         if final_status.get('warnings'):
-            print(f"Warnings: {final_status.get('warnings')}")
+            _log.warning("Warnings: %s", final_status.get('warnings'))
             
         return final_status
 
@@ -721,11 +1685,7 @@ class VenaETL:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"{self.job_status_url}/{job_id}/cancel"
-        response = requests.post(
-            url,
-            headers=self.headers,
-            auth=(self.api_user, self.api_key)
-        )
+        url = self._job_url(job_id, "cancel")
+        response = self._session.post(url)
         response.raise_for_status()
-        return response.json() 
\ No newline at end of file
+        return self._loads_response(response) 
\ No newline at end of file